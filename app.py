@@ -1,8 +1,20 @@
 import streamlit as st
-import pandas as pd
-from datetime import datetime, time
-import pytz
-from typing import Optional
+from datetime import datetime
+
+from timetable_core import (
+    KST,
+    WEEKDAY_MAP,
+    WEEKDAYS_SCHOOL,
+    build_class_index,
+    build_pe_by_weekday,
+    build_pe_index,
+    build_weekday_summaries,
+    check_pe,
+    get_period_from_now,
+    get_today_pe_periods_for_class,
+    load_timetable,
+    pe_only,
+)
 
 # ==============================
 # 0. 간단 스타일 (버튼 색 강조)
@@ -29,122 +41,7 @@ CUSTOM_CSS = """
 """
 
 # ==============================
-# 1. 설정: 교시 시간대 (학교 시간)
-# ==============================
-PERIOD_SCHEDULE = [
-    {"period": 1, "start": "08:50", "end": "09:40"},
-    {"period": 2, "start": "09:50", "end": "10:40"},
-    {"period": 3, "start": "10:50", "end": "11:40"},
-    {"period": 4, "start": "11:50", "end": "12:40"},
-    {"period": 5, "start": "13:40", "end": "14:30"},
-    {"period": 6, "start": "14:40", "end": "15:30"},
-    {"period": 7, "start": "15:40", "end": "16:30"},
-]
-
-PE_KEYWORD = "체육"
-KST = pytz.timezone("Asia/Seoul")
-
-WEEKDAY_MAP = {
-    0: "월요일",
-    1: "화요일",
-    2: "수요일",
-    3: "목요일",
-    4: "금요일",
-    5: "토요일",
-    6: "일요일",
-}
-
-
-# ==============================
-# 2. 시간표 관련 함수
-# ==============================
-@st.cache_data
-def load_timetable(path: str) -> pd.DataFrame:
-    """timetable.xlsx -> DataFrame (학년, 반, 요일, 교시, 과목)"""
-    df = pd.read_excel(path)
-
-    df["학년"] = df["학년"].astype(int)
-    df["반"] = df["반"].astype(int)
-    df["교시"] = df["교시"].astype(int)
-    df["요일"] = df["요일"].astype(str)
-    df["과목"] = df["과목"].astype(str)
-
-    return df
-
-
-def get_period_from_now(now: datetime) -> Optional[int]:
-    """현재 시간이 몇 교시인지 PERIOD_SCHEDULE 보고 판단.
-    수업 시간이 아니면(None) 반환
-    """
-    current_t = now.time()
-
-    def parse_hm(hm_str: str) -> time:
-        return datetime.strptime(hm_str, "%H:%M").time()
-
-    for item in PERIOD_SCHEDULE:
-        start_t = parse_hm(item["start"])
-        end_t = parse_hm(item["end"])
-        if start_t <= current_t < end_t:
-            return item["period"]
-
-    return None
-
-
-def check_pe(df: pd.DataFrame, grade: int, class_no: int, weekday: str, period: int) -> bool:
-    """해당 학년/반/요일/교시에 체육이 있는지 여부."""
-    cond = (
-        (df["학년"] == grade)
-        & (df["반"] == class_no)
-        & (df["요일"] == weekday)
-        & (df["교시"] == period)
-    )
-    sub_df = df[cond]
-
-    if sub_df.empty:
-        return False
-
-    return any(PE_KEYWORD in subj for subj in sub_df["과목"])
-
-
-def get_today_pe_summary(df: pd.DataFrame, weekday: str) -> pd.DataFrame:
-    """오늘 요일 기준으로, 어떤 학년/반이 몇 교시에 체육이 있는지 요약."""
-    cond = (df["요일"] == weekday) & (df["과목"].str.contains(PE_KEYWORD))
-    sub = df[cond].copy()
-
-    if sub.empty:
-        return pd.DataFrame(columns=["학년", "반", "체육 교시"])
-
-    grouped = (
-        sub.groupby(["학년", "반"])["교시"]
-        .apply(lambda s: ", ".join(str(p) + "교시" for p in sorted(s.unique())))
-        .reset_index()
-        .rename(columns={"교시": "체육 교시"})
-        .sort_values(["학년", "반"])
-        .reset_index(drop=True)
-    )
-    return grouped
-
-
-def get_today_pe_periods_for_class(
-    df: pd.DataFrame, grade: int, class_no: int, weekday: str
-) -> list[int]:
-    """특정 학년/반이 오늘(weekday) 몇 교시에 체육이 있는지 리스트로 반환."""
-    cond = (
-        (df["학년"] == grade)
-        & (df["반"] == class_no)
-        & (df["요일"] == weekday)
-        & (df["과목"].str.contains(PE_KEYWORD))
-    )
-    sub = df[cond]
-
-    if sub.empty:
-        return []
-
-    return sorted(sub["교시"].unique())
-
-
-# ==============================
-# 3. Streamlit UI
+# 1. Streamlit UI
 # ==============================
 
 def main():
@@ -167,20 +64,26 @@ def main():
         st.error(str(e))
         st.stop()
 
-    # 학년/반 목록
-    grades = sorted(df_timetable["학년"].unique())
-    classes_by_grade = {
-        g: sorted(df_timetable[df_timetable["학년"] == g]["반"].unique())
-        for g in grades
-    }
+    # 학년/반 목록 (세션당 한 번만 계산; 세션 중 시간표가 바뀌어도 의도적으로 처음 값을 유지)
+    if "grades" not in st.session_state:
+        st.session_state.grades, st.session_state.classes_by_grade = build_class_index(
+            df_timetable
+        )
+    grades = st.session_state.grades
+    classes_by_grade = st.session_state.classes_by_grade
+
+    # 체육 행만 걸러 둔 시간표로 조회용 구조를 만듦
+    df_pe = pe_only(df_timetable)
+    pe_by_wd = build_pe_by_weekday(df_pe)
+    pe_index = build_pe_index(df_pe)
+    pe_summaries = build_weekday_summaries(df_pe)
 
     # ---- 현재 시간 & 오늘 요일 ----
-    now_utc = datetime.utcnow().replace(tzinfo=pytz.utc)
-    now_kst = now_utc.astimezone(KST)
+    now_kst = datetime.now(KST)
     weekday_name = WEEKDAY_MAP[now_kst.weekday()]  # ex) "월요일"
 
     # 👉 현재 교시 안내 (교시가 아니면 쉬는시간/점심시간으로 간주)
-    if weekday_name in ["월요일", "화요일", "수요일", "목요일", "금요일"]:
+    if weekday_name in WEEKDAYS_SCHOOL:
         current_period = get_period_from_now(now_kst)
         if current_period is not None:
             st.write(f"현재 시간은 **{current_period}교시** 입니다.")
@@ -215,13 +118,13 @@ def main():
 
         st.markdown("---")
 
-        if weekday_name not in ["월요일", "화요일", "수요일", "목요일", "금요일"]:
+        if weekday_name not in WEEKDAYS_SCHOOL:
             st.warning("📌 오늘은 토요일/일요일이므로 수업 시간이 아닐 가능성이 큽니다.")
         else:
             if st.button("현재 시간 기준 체육시간 여부 확인"):
                 # 오늘 이 반의 체육 교시 목록
                 today_periods = get_today_pe_periods_for_class(
-                    df_timetable,
+                    pe_index,
                     grade=selected_grade,
                     class_no=selected_class,
                     weekday=weekday_name,
@@ -230,7 +133,7 @@ def main():
                 # 1) 지금이 수업 시간일 때: 현재 교시가 체육인지 체크
                 if current_period is not None:
                     is_pe = check_pe(
-                        df_timetable,
+                        pe_by_wd,
                         grade=selected_grade,
                         class_no=selected_class,
                         weekday=weekday_name,
@@ -277,8 +180,8 @@ def main():
     with col_right:
         st.subheader("📅 오늘 요일 기준 체육 시간 요약")
 
-        if weekday_name in ["월요일", "화요일", "수요일", "목요일", "금요일"]:
-            df_today_pe = get_today_pe_summary(df_timetable, weekday_name)
+        if weekday_name in WEEKDAYS_SCHOOL:
+            df_today_pe = pe_summaries[weekday_name]
 
             if df_today_pe.empty:
                 st.warning(
@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+
+from timetable_core import pe_mask
+
+
+def test_pe_mask_ignores_blank_subject():
+    # 마지막 카테고리("체육(실내)")가 체육이어도 빈 칸은 체육이 아님
+    df = pd.DataFrame({"과목": ["체육", "체육(실내)", np.nan, "국어"]})
+    df["과목"] = df["과목"].astype("category")
+
+    assert pe_mask(df).tolist() == [True, True, False, False]
+
+
+def test_pe_mask_all_blank_subjects():
+    # 과목이 전부 빈 칸이면 카테고리가 비어 있어도 오류 없이 전부 False
+    df = pd.DataFrame({"과목": [np.nan, np.nan]})
+    df["과목"] = df["과목"].astype("category")
+
+    assert pe_mask(df).tolist() == [False, False]
@@ -0,0 +1,188 @@
+import bisect
+import streamlit as st
+import pandas as pd
+import numpy as np
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from typing import Optional
+
+# ==============================
+# 1. 설정: 교시 시간대 (학교 시간)
+# ==============================
+PERIOD_SCHEDULE = [
+    {"period": 1, "start": "08:50", "end": "09:40"},
+    {"period": 2, "start": "09:50", "end": "10:40"},
+    {"period": 3, "start": "10:50", "end": "11:40"},
+    {"period": 4, "start": "11:50", "end": "12:40"},
+    {"period": 5, "start": "13:40", "end": "14:30"},
+    {"period": 6, "start": "14:40", "end": "15:30"},
+    {"period": 7, "start": "15:40", "end": "16:30"},
+]
+
+# 교시 판별용: (시작, 끝, 교시) 튜플로 한 번만 변환해 둠
+_PERIOD_TUPLES = [
+    (
+        datetime.strptime(item["start"], "%H:%M").time(),
+        datetime.strptime(item["end"], "%H:%M").time(),
+        item["period"],
+    )
+    for item in PERIOD_SCHEDULE
+]
+# 시작 시각 기준 이진 탐색용 (PERIOD_SCHEDULE은 정렬돼 있고 겹치지 않음)
+_STARTS = [s for s, _, _ in _PERIOD_TUPLES]
+_ENDS = [e for _, e, _ in _PERIOD_TUPLES]
+_PERIODS = [p for _, _, p in _PERIOD_TUPLES]
+
+PE_KEYWORD = "체육"
+KST = ZoneInfo("Asia/Seoul")
+
+WEEKDAY_MAP = {
+    0: "월요일",
+    1: "화요일",
+    2: "수요일",
+    3: "목요일",
+    4: "금요일",
+    5: "토요일",
+    6: "일요일",
+}
+
+# 정규 수업이 있는 요일
+WEEKDAYS_SCHOOL = frozenset(("월요일", "화요일", "수요일", "목요일", "금요일"))
+
+
+# ==============================
+# 2. 시간표 관련 함수
+# ==============================
+@st.cache_data
+def load_timetable(path: str) -> pd.DataFrame:
+    """timetable.xlsx -> DataFrame (학년, 반, 요일, 교시, 과목)"""
+    df = pd.read_excel(path, engine="calamine")
+
+    # 숫자는 int8, 문자열은 category로 줄여서 비교 시 읽는 바이트 수를 줄임
+    df["학년"] = df["학년"].astype("int8")
+    df["반"] = df["반"].astype("int8")
+    df["교시"] = df["교시"].astype("int8")
+    df["요일"] = df["요일"].astype(str).astype("category")
+    df["과목"] = df["과목"].astype(str).astype("category")
+
+    return df
+
+
+def pe_mask(df: pd.DataFrame) -> np.ndarray:
+    """과목에 체육이 포함된 행 마스크. 카테고리별로 한 번만 문자열 검사."""
+    subjects = df["과목"]
+    is_pe_cat = subjects.cat.categories.str.contains(PE_KEYWORD, regex=False)
+    codes = subjects.cat.codes.to_numpy()
+    # 빈 칸(NaN)은 코드가 -1이므로 유효한 코드만 카테고리 플래그를 읽음
+    mask = np.zeros(len(codes), dtype=bool)
+    valid = codes >= 0
+    mask[valid] = is_pe_cat[codes[valid]]
+    return mask
+
+
+def weekday_mask(df: pd.DataFrame, weekday: str) -> np.ndarray:
+    """요일 마스크. 문자열 대신 카테고리 코드(정수)끼리 비교."""
+    days = df["요일"]
+    try:
+        wd_code = days.cat.categories.get_loc(weekday)
+    except KeyError:
+        return np.zeros(len(df), dtype=bool)
+    return days.cat.codes.to_numpy() == wd_code
+
+
+@st.cache_data
+def pe_only(df: pd.DataFrame) -> pd.DataFrame:
+    """체육 행만 남긴 시간표. 이후 체육 관련 함수는 모두 이걸 받음."""
+    return df[pe_mask(df)].reset_index(drop=True)
+
+
+@st.cache_data
+def build_class_index(df: pd.DataFrame) -> tuple[list[int], dict[int, list[int]]]:
+    """학년 목록과 학년별 반 목록을 한 번만 계산."""
+    grades = sorted(df["학년"].unique())
+    classes_by_grade = {
+        g: sorted(df.loc[df["학년"] == g, "반"].unique())
+        for g in grades
+    }
+    return grades, classes_by_grade
+
+
+def get_period_from_now(now: datetime) -> Optional[int]:
+    """현재 시간이 몇 교시인지 PERIOD_SCHEDULE 보고 판단.
+    수업 시간이 아니면(None) 반환
+    """
+    current_t = now.time()
+
+    idx = bisect.bisect_right(_STARTS, current_t) - 1
+    if idx >= 0 and current_t < _ENDS[idx]:
+        return _PERIODS[idx]
+
+    return None
+
+
+@st.cache_data
+def build_pe_by_weekday(df_pe: pd.DataFrame) -> dict[str, frozenset[tuple[int, int, int]]]:
+    """{요일: 체육이 있는 (학년, 반, 교시) 집합} 형태로 한 번만 모아 둠."""
+    d: dict[str, set[tuple[int, int, int]]] = {}
+    for wd, g, c, p in zip(
+        df_pe["요일"].tolist(),
+        df_pe["학년"].tolist(),
+        df_pe["반"].tolist(),
+        df_pe["교시"].tolist(),
+    ):
+        d.setdefault(wd, set()).add((g, c, p))
+    return {k: frozenset(v) for k, v in d.items()}
+
+
+def check_pe(
+    pe_by_wd: dict[str, frozenset[tuple[int, int, int]]],
+    grade: int,
+    class_no: int,
+    weekday: str,
+    period: int,
+) -> bool:
+    """해당 학년/반/요일/교시에 체육이 있는지 여부."""
+    return (grade, class_no, period) in pe_by_wd.get(weekday, frozenset())
+
+
+def get_today_pe_summary(df_pe: pd.DataFrame, weekday: str) -> pd.DataFrame:
+    """오늘 요일 기준으로, 어떤 학년/반이 몇 교시에 체육이 있는지 요약."""
+    sub = df_pe.loc[weekday_mask(df_pe, weekday), ["학년", "반", "교시"]]
+
+    if sub.empty:
+        return pd.DataFrame(columns=["학년", "반", "체육 교시"])
+
+    # 한 번 정렬/중복 제거 후 라벨을 만들어 두면 그룹별 파이썬 콜백 없이 join만 하면 됨
+    sub = sub.sort_values(["학년", "반", "교시"]).drop_duplicates().copy()
+    sub["체육 교시"] = sub["교시"].astype(str) + "교시"
+
+    grouped = (
+        sub.groupby(["학년", "반"], as_index=False, sort=True)["체육 교시"]
+        .agg(", ".join)
+    )
+    return grouped
+
+
+@st.cache_data
+def build_weekday_summaries(df_pe: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """수업 요일 5개의 체육 요약을 미리 모두 계산."""
+    return {wd: get_today_pe_summary(df_pe, wd) for wd in WEEKDAYS_SCHOOL}
+
+
+@st.cache_data
+def build_pe_index(df_pe: pd.DataFrame) -> dict[str, dict[tuple[int, int], list[int]]]:
+    """{요일: {(학년, 반): 정렬된 체육 교시 리스트}} 형태로 한 번만 계산."""
+    out: dict[str, dict[tuple[int, int], list[int]]] = {}
+    for (wd, g, c), sub in df_pe.groupby(["요일", "학년", "반"], observed=True):
+        out.setdefault(wd, {})[(g, c)] = sorted(sub["교시"].unique().tolist())
+    return out
+
+
+def get_today_pe_periods_for_class(
+    pe_index: dict[str, dict[tuple[int, int], list[int]]],
+    grade: int,
+    class_no: int,
+    weekday: str,
+) -> list[int]:
+    """특정 학년/반이 오늘(weekday) 몇 교시에 체육이 있는지 리스트로 반환."""
+    return pe_index.get(weekday, {}).get((grade, class_no), [])